@@ -0,0 +1,52 @@
+"""Shared fixtures for the Unified Catalog client tests."""
+import json
+import time
+from unittest import mock
+
+import pytest
+
+from unifiedcatalogpy.api_client import ApiClient
+
+
+@pytest.fixture
+def credential():
+    """A credential returning a token that is valid for an hour."""
+    credential = mock.Mock()
+    credential.get_token.return_value = mock.Mock(
+        token="test-token", expires_on=time.time() + 3600
+    )
+    return credential
+
+
+def _make_response(status_code=200, body=None, headers=None, reason="OK"):
+    """Build a mock requests.Response with a JSON body."""
+    response = mock.Mock()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = headers or {}
+    response.content = b"" if body is None else json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture
+def make_response():
+    """Factory for mock responses, e.g. make_response(429, headers={...})."""
+    return _make_response
+
+
+@pytest.fixture
+def api_client(credential):
+    """An ApiClient whose session is mocked, so no real requests are made."""
+    client = ApiClient(
+        "https://account-api.purview-service.microsoft.com/datagovernance/catalog",
+        credential,
+    )
+    client._session.request = mock.Mock(return_value=_make_response())
+    return client
+
+
+@pytest.fixture
+def no_sleep():
+    """Patch out the backoff so retry tests run instantly."""
+    with mock.patch("unifiedcatalogpy.retry.time.sleep") as sleep:
+        yield sleep
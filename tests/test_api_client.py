@@ -0,0 +1,56 @@
+"""Tests for unifiedcatalogpy.api_client."""
+
+import pytest
+import requests
+
+from unifiedcatalogpy.exceptions import APIError, RequestError
+
+
+class TestRetries:
+    def test_get_retries_read_timeouts(
+        self, api_client, no_sleep, make_response
+    ):
+        api_client._session.request.side_effect = [
+            requests.exceptions.ReadTimeout(),
+            make_response(body={"id": "1"}),
+        ]
+        assert api_client.get("/terms/1").data == {"id": "1"}
+        assert api_client._session.request.call_count == 2
+
+    def test_post_is_not_replayed_after_read_timeout(self, api_client, no_sleep):
+        api_client._session.request.side_effect = (
+            requests.exceptions.ReadTimeout()
+        )
+        with pytest.raises(RequestError):
+            api_client.post("/objectives", data={"definition": "x"})
+        assert api_client._session.request.call_count == 1
+
+    def test_post_is_not_replayed_after_server_error(
+        self, api_client, no_sleep, make_response
+    ):
+        api_client._session.request.return_value = make_response(
+            500, reason="Internal Server Error"
+        )
+        with pytest.raises(APIError):
+            api_client.post("/objectives", data={"definition": "x"})
+        assert api_client._session.request.call_count == 1
+
+    def test_post_retries_throttling(
+        self, api_client, no_sleep, make_response
+    ):
+        api_client._session.request.side_effect = [
+            make_response(429, headers={"Retry-After": "1"}),
+            make_response(201, body={"id": "1"}),
+        ]
+        assert api_client.post("/objectives", data={}).status_code == 201
+        no_sleep.assert_called_once_with(1.0)
+
+    def test_infinite_retry_after_raises_the_api_error(
+        self, api_client, no_sleep, make_response
+    ):
+        api_client._session.request.return_value = make_response(
+            429, headers={"Retry-After": "inf"}
+        )
+        with pytest.raises(APIError) as error:
+            api_client.get("/terms")
+        assert error.value.status_code == 429
@@ -0,0 +1,175 @@
+"""Tests for unifiedcatalogpy.async_client, using httpx.MockTransport."""
+import asyncio
+import json
+import time
+from unittest import mock
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from unifiedcatalogpy.async_client import AsyncApiClient  # noqa: E402
+
+BASE_URL = (
+    "https://account-api.purview-service.microsoft.com/datagovernance/catalog/"
+)
+
+
+def json_response(body, status_code=200):
+    """Build an httpx response with a JSON body."""
+    return httpx.Response(status_code, content=json.dumps(body).encode())
+
+
+@pytest.fixture
+def make_client(credential):
+    """
+    Factory for an AsyncApiClient built outside any event loop, whose
+    requests are answered by the given (async) handler.
+    """
+    def make(handler):
+        client = AsyncApiClient(BASE_URL, credential)
+        client._session = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    return make
+
+
+class TestTokenLock:
+    def test_lock_is_created_inside_the_running_loop(
+        self, make_client, credential
+    ):
+        async def handler(request):
+            await asyncio.sleep(0)
+            return json_response({})
+
+        client = make_client(handler)
+        assert client._token_lock is None
+
+        async def main():
+            async with client:
+                await client.gather([client.get("a"), client.get("b")])
+
+        asyncio.run(main())
+        assert client._token_lock is not None
+        credential.get_token.assert_called_once()
+
+    def test_async_credentials_are_awaited(self, make_client, credential):
+        credential.get_token = mock.AsyncMock(
+            return_value=mock.Mock(token="async", expires_on=time.time() + 3600)
+        )
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["Authorization"])
+            return json_response({})
+
+        client = make_client(handler)
+        asyncio.run(client.get("terms"))
+        assert seen == ["Bearer async"]
+
+
+class TestRetries:
+    def test_server_errors_are_retried(self, make_client):
+        responses = [json_response({}, 503), json_response({"id": "1"})]
+
+        def handler(request):
+            return responses.pop(0)
+
+        client = make_client(handler)
+        with mock.patch(
+            "unifiedcatalogpy.retry.asyncio.sleep", mock.AsyncMock()
+        ):
+            result = asyncio.run(client.get("terms/1"))
+        assert result.data == {"id": "1"}
+        assert responses == []
+
+
+class TestGather:
+    def test_limits_concurrency_and_keeps_order(self, make_client):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json_response({"path": request.url.path})
+
+        client = make_client(handler)
+
+        async def main():
+            calls = [client.get(f"terms/{i}") for i in range(10)]
+            return await client.gather(calls, concurrency=3)
+
+        results = asyncio.run(main())
+        assert peak == 3
+        assert [r.data["path"].rsplit("/", 1)[-1] for r in results] == [
+            str(i) for i in range(10)
+        ]
+
+
+class TestGetPaginatedIter:
+    def test_follows_tokens_across_pages(self, make_client):
+        def handler(request):
+            if "$skipToken" in request.url.params:
+                return json_response({"value": [3]})
+            assert request.url.params["$top"] == "2"
+            return json_response({"value": [1, 2], "continuationToken": "t"})
+
+        client = make_client(handler)
+
+        async def main():
+            return [item async for item in client.get_paginated_iter(
+                "terms", page_size=2
+            )]
+
+        assert asyncio.run(main()) == [1, 2, 3]
+
+    def test_next_page_is_requested_before_items_are_consumed(
+        self, make_client
+    ):
+        async def main():
+            second_page_requested = asyncio.Event()
+
+            async def handler(request):
+                if "$skipToken" in request.url.params:
+                    second_page_requested.set()
+                    return json_response({"value": [3]})
+                return json_response({"value": [1, 2], "continuationToken": "t"})
+
+            client = make_client(handler)
+            pages = client.get_paginated_iter("terms")
+            assert await pages.__anext__() == 1
+            # Still on the first page's items, but page two is in flight.
+            await asyncio.wait_for(second_page_requested.wait(), timeout=1)
+            assert [item async for item in pages] == [2, 3]
+
+        asyncio.run(main())
+
+    def test_closing_early_cancels_the_prefetch(self, make_client):
+        async def main():
+            prefetch_started = asyncio.Event()
+            prefetch_cancelled = asyncio.Event()
+
+            async def handler(request):
+                if "$skipToken" not in request.url.params:
+                    return json_response({"value": [1], "continuationToken": "t"})
+                prefetch_started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    prefetch_cancelled.set()
+                    raise
+
+            client = make_client(handler)
+            pages = client.get_paginated_iter("terms")
+            assert await pages.__anext__() == 1
+            await asyncio.wait_for(prefetch_started.wait(), timeout=1)
+            await pages.aclose()
+            await asyncio.wait_for(prefetch_cancelled.wait(), timeout=1)
+
+        asyncio.run(main())
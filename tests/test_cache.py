@@ -0,0 +1,61 @@
+"""Tests for the ApiClient GET response cache."""
+from unittest import mock
+
+import pytest
+
+
+class TestCache:
+    @pytest.fixture
+    def cached_client(self, api_client, make_response):
+        api_client.cache_ttl = 60
+        api_client._session.request.return_value = make_response(
+            body={"contacts": {"owner": [{"id": "a"}]}}
+        )
+        return api_client
+
+    def test_repeated_gets_are_served_from_cache(self, cached_client):
+        cached_client.get("/terms/1")
+        cached_client.get("/terms/1")
+        assert cached_client._session.request.call_count == 1
+
+    def test_entries_expire_after_ttl(self, cached_client):
+        with mock.patch("unifiedcatalogpy.api_client.time.monotonic") as now:
+            now.return_value = 1000
+            cached_client.get("/terms/1")
+            now.return_value = 1061
+            cached_client.get("/terms/1")
+        assert cached_client._session.request.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self, cached_client):
+        cached_client.cache_max_entries = 2
+        cached_client.get("/terms/1")
+        cached_client.get("/terms/2")
+        cached_client.get("/terms/1")
+        cached_client.get("/terms/3")
+        cached_client.get("/terms/1")
+        assert cached_client._session.request.call_count == 3
+        cached_client.get("/terms/2")
+        assert cached_client._session.request.call_count == 4
+
+    def test_no_store_responses_are_not_cached(
+        self, cached_client, make_response
+    ):
+        cached_client._session.request.return_value = make_response(
+            body={}, headers={"Cache-Control": "private, no-store"}
+        )
+        cached_client.get("/terms/1")
+        cached_client.get("/terms/1")
+        assert cached_client._session.request.call_count == 2
+
+    def test_writes_clear_the_cache(self, cached_client):
+        cached_client.get("/terms/1")
+        cached_client.put("/terms/1", data={})
+        cached_client.get("/terms/1")
+        assert cached_client._session.request.call_count == 3
+
+    def test_nested_mutations_do_not_reach_the_cache(self, cached_client):
+        cached_client.get("/terms/1").data["contacts"]["owner"].append(
+            {"id": "b"}
+        )
+        data = cached_client.get("/terms/1").data
+        assert data == {"contacts": {"owner": [{"id": "a"}]}}
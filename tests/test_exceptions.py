@@ -0,0 +1,50 @@
+"""Tests for unifiedcatalogpy.exceptions."""
+import time
+from email.utils import formatdate
+
+import pytest
+
+from unifiedcatalogpy.exceptions import (
+    APIError,
+    AuthenticationError,
+    _parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("5", 5.0), ("0.5", 0.5), ("-3", 0.0), ("0", 0.0)],
+    )
+    def test_parses_seconds(self, value, expected):
+        assert _parse_retry_after(value) == expected
+
+    @pytest.mark.parametrize(
+        "value", [None, "", "soon", "inf", "-inf", "nan", "1e400"]
+    )
+    def test_rejects_missing_invalid_and_non_finite_values(self, value):
+        assert _parse_retry_after(value) is None
+
+    def test_parses_http_date(self):
+        value = formatdate(time.time() + 60, usegmt=True)
+        assert 55 <= _parse_retry_after(value) <= 60
+
+    def test_http_date_in_the_past_means_no_wait(self):
+        value = formatdate(time.time() - 60, usegmt=True)
+        assert _parse_retry_after(value) == 0.0
+
+
+class TestFromResponse:
+    @pytest.mark.parametrize("status_code", [401, 403])
+    def test_auth_failures_raise_authentication_error(self, status_code):
+        error = APIError.from_response(status_code, "Denied", {})
+        assert isinstance(error, AuthenticationError)
+        assert error.status_code == status_code
+
+    def test_other_errors_carry_retry_after(self):
+        error = APIError.from_response(
+            429, "Too Many Requests", {"Retry-After": "7"}
+        )
+        assert type(error) is APIError
+        assert error.retry_after == 7.0
+        assert str(error) == "429: Too Many Requests"
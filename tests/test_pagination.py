@@ -0,0 +1,120 @@
+"""Tests for following continuation tokens across list pages."""
+import pytest
+
+from unifiedcatalogpy.exceptions import RequestError
+from unifiedcatalogpy.models import PaginationOptions
+from unifiedcatalogpy.utils import is_next_link, next_page_request
+
+BASE_URL = (
+    "https://account-api.purview-service.microsoft.com/datagovernance/catalog/"
+)
+
+
+class TestNextPageRequest:
+    def test_follows_next_link_under_base_url(self):
+        endpoint, params = next_page_request(
+            BASE_URL, "terms", {"$top": 10}, f"{BASE_URL}terms?$skipToken=abc"
+        )
+        assert endpoint == "terms?$skipToken=abc"
+        assert params is None
+
+    def test_host_and_scheme_are_compared_case_insensitively(self):
+        link = BASE_URL.replace("https://account", "HTTPS://ACCOUNT")
+        endpoint, params = next_page_request(
+            BASE_URL, "terms", {}, f"{link}terms?$skipToken=abc"
+        )
+        assert endpoint == "terms?$skipToken=abc"
+        assert params is None
+
+    def test_sends_other_tokens_as_skip_token(self):
+        params = {"$top": 10}
+        endpoint, next_params = next_page_request(
+            BASE_URL, "terms", params, "abc"
+        )
+        assert endpoint == "terms"
+        assert next_params == {"$top": 10, "$skipToken": "abc"}
+        assert params == {"$top": 10}, "the first page's params are unchanged"
+
+    @pytest.mark.parametrize(
+        "link",
+        [
+            "https://example.com/terms?$skipToken=abc",
+            BASE_URL.replace("https://", "http://") + "terms",
+            BASE_URL.replace("/catalog/", "/other/") + "terms",
+        ],
+    )
+    def test_rejects_links_outside_base_url(self, link):
+        with pytest.raises(RequestError):
+            next_page_request(BASE_URL, "terms", {}, link)
+
+    @pytest.mark.parametrize(
+        "token, expected",
+        [
+            ("abc", False),
+            ("eyJza2lwIjoxMH0=", False),
+            ("https://example.com/terms", True),
+            ("ftp://example.com/terms", False),
+        ],
+    )
+    def test_is_next_link(self, token, expected):
+        assert is_next_link(token) is expected
+
+
+class TestGetPaginated:
+    def test_page_with_token_has_more(self, api_client, make_response):
+        api_client._session.request.return_value = make_response(
+            body={"value": [1, 2], "continuationToken": "abc", "totalCount": 5}
+        )
+        page = api_client.get_paginated("terms", PaginationOptions(page_size=2))
+        assert page.items == [1, 2]
+        assert page.total_count == 5
+        assert page.continuation_token == "abc"
+        assert page.has_more
+
+    def test_last_page_has_no_more(self, api_client, make_response):
+        api_client._session.request.return_value = make_response(
+            body={"value": [1]}
+        )
+        page = api_client.get_paginated("terms")
+        assert page.continuation_token is None
+        assert not page.has_more
+
+    def test_sends_continuation_token_as_skip_token(
+        self, api_client, make_response
+    ):
+        api_client._session.request.return_value = make_response(
+            body={"value": []}
+        )
+        api_client.get_paginated(
+            "terms", PaginationOptions(page_size=10, continuation_token="abc")
+        )
+        _, kwargs = api_client._session.request.call_args
+        assert kwargs["params"] == {"$top": 10, "$skipToken": "abc"}
+
+
+class TestIterItems:
+    def test_follows_tokens_until_the_last_page(
+        self, api_client, make_response
+    ):
+        api_client._session.request.side_effect = [
+            make_response(body={"value": [1, 2], "continuationToken": "t1"}),
+            make_response(
+                body={"value": [3], "@odata.nextLink": f"{BASE_URL}terms?p=3"}
+            ),
+            make_response(body={"value": [4]}),
+        ]
+        assert list(api_client.iter_items("terms", page_size=2)) == [1, 2, 3, 4]
+        calls = api_client._session.request.call_args_list
+        assert calls[1].kwargs["params"] == {"$top": 2, "$skipToken": "t1"}
+        assert calls[2].args[1] == f"{BASE_URL}terms?p=3"
+        assert calls[2].kwargs["params"] is None
+
+    def test_foreign_next_link_raises_instead_of_looping(
+        self, api_client, make_response
+    ):
+        api_client._session.request.return_value = make_response(
+            body={"value": [1], "@odata.nextLink": "https://example.com/terms"}
+        )
+        with pytest.raises(RequestError):
+            list(api_client.iter_items("terms"))
+        assert api_client._session.request.call_count == 1
@@ -0,0 +1,196 @@
+"""Tests for unifiedcatalogpy.retry."""
+import asyncio
+from unittest import mock
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from unifiedcatalogpy.exceptions import APIError, AuthenticationError
+from unifiedcatalogpy.retry import (
+    RetryConfig,
+    calculate_delay,
+    retry_on_failure,
+    should_retry,
+)
+
+
+def connection_refused():
+    """A requests ConnectionError raised before the request was sent."""
+    return requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+    )
+
+
+class TestRetryConfig:
+    def test_rejects_non_positive_max_attempts(self):
+        with pytest.raises(ValueError):
+            RetryConfig(max_attempts=0)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"jitter": -0.1},
+            {"jitter": 1.5},
+            {"base_delay": -1},
+            {"max_delay": -1},
+        ],
+    )
+    def test_rejects_invalid_delays_and_jitter(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryConfig(**kwargs)
+
+
+class TestBackoffSchedule:
+    @pytest.mark.parametrize(
+        "name", ["max_attempts", "base_delay", "max_delay", "exponential_base"]
+    )
+    def test_schedule_inputs_are_read_only(self, name):
+        config = RetryConfig()
+        with pytest.raises(AttributeError):
+            setattr(config, name, 10)
+
+    def test_long_schedules_do_not_overflow(self):
+        config = RetryConfig(max_attempts=1100, max_delay=30, jitter=0)
+        assert len(config._delays) == 1100
+        assert calculate_delay(1099, config) == 30
+
+    @pytest.mark.parametrize("exponential_base", [2, 2.0])
+    def test_attempts_beyond_the_table_do_not_overflow(self, exponential_base):
+        config = RetryConfig(
+            max_attempts=2, exponential_base=exponential_base, jitter=0
+        )
+        assert calculate_delay(5000, config) == config.max_delay
+
+
+class TestCalculateDelay:
+    def test_grows_exponentially_and_is_capped(self):
+        config = RetryConfig(
+            max_attempts=6, base_delay=1, max_delay=5, jitter=0
+        )
+        delays = [calculate_delay(attempt, config) for attempt in range(1, 6)]
+        assert delays == [1, 2, 4, 5, 5]
+
+    def test_attempts_beyond_the_table_use_the_same_formula(self):
+        config = RetryConfig(max_attempts=2, base_delay=1, jitter=0)
+        assert calculate_delay(3, config) == 4
+
+    def test_jitter_stays_within_bounds(self):
+        config = RetryConfig(base_delay=10, jitter=0.5)
+        for _ in range(100):
+            assert 5 <= calculate_delay(1, config) <= 15
+
+    def test_delay_is_never_negative(self):
+        config = RetryConfig(base_delay=1)
+        config.jitter = 1.5
+        for _ in range(100):
+            assert calculate_delay(1, config) >= 0
+
+    def test_retry_after_is_used_without_jitter(self):
+        config = RetryConfig(jitter=0.5)
+        assert calculate_delay(1, config, retry_after=3) == 3
+
+    def test_retry_after_is_capped_at_max_delay(self):
+        config = RetryConfig(max_delay=10)
+        assert calculate_delay(1, config, retry_after=86400) == 10
+
+    @pytest.mark.parametrize("retry_after", [float("inf"), float("nan")])
+    def test_non_finite_retry_after_falls_back_to_backoff(self, retry_after):
+        config = RetryConfig(base_delay=1, jitter=0)
+        assert calculate_delay(1, config, retry_after=retry_after) == 1
+
+
+class TestShouldRetry:
+    config = RetryConfig()
+
+    @pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+    @pytest.mark.parametrize("http_method", ["GET", "PUT", "DELETE"])
+    def test_idempotent_requests_retry_server_errors(
+        self, status_code, http_method
+    ):
+        assert should_retry(APIError(status_code), self.config, http_method)
+
+    @pytest.mark.parametrize("status_code", [400, 404, 409])
+    def test_client_errors_are_not_retried(self, status_code):
+        assert not should_retry(APIError(status_code), self.config)
+
+    def test_authentication_errors_are_not_retried(self):
+        assert not should_retry(AuthenticationError(401), self.config)
+
+    @pytest.mark.parametrize(
+        "exception, expected",
+        [
+            (APIError(429), True),
+            (APIError(503, retry_after=1), True),
+            (APIError(503), False),
+            (APIError(500), False),
+            (APIError(502), False),
+            (requests.exceptions.ConnectTimeout(), True),
+            (connection_refused(), True),
+            (requests.exceptions.ReadTimeout(), False),
+            (requests.exceptions.ConnectionError("Connection aborted"), False),
+        ],
+    )
+    def test_post_is_only_retried_when_not_applied(self, exception, expected):
+        assert should_retry(exception, self.config, "POST") is expected
+
+    def test_retry_after_longer_than_max_delay_is_not_retried(self):
+        config = RetryConfig(max_delay=30)
+        assert not should_retry(APIError(429, retry_after=60), config)
+        assert should_retry(APIError(429, retry_after=30), config)
+
+    def test_unrelated_exceptions_are_not_retried(self):
+        assert not should_retry(ValueError(), self.config)
+
+
+class TestRetryOnFailure:
+    def test_retries_until_success(self, no_sleep):
+        func = mock.Mock(side_effect=[APIError(503), APIError(503), "ok"])
+        wrapped = retry_on_failure(RetryConfig(max_attempts=3))(func)
+        assert wrapped() == "ok"
+        assert func.call_count == 3
+        assert no_sleep.call_count == 2
+
+    def test_raises_after_max_attempts(self, no_sleep):
+        func = mock.Mock(side_effect=APIError(503))
+        wrapped = retry_on_failure(RetryConfig(max_attempts=3))(func)
+        with pytest.raises(APIError):
+            wrapped()
+        assert func.call_count == 3
+
+    def test_sleeps_for_retry_after(self, no_sleep):
+        func = mock.Mock(side_effect=[APIError(429, retry_after=2), "ok"])
+        retry_on_failure(RetryConfig(jitter=0.5))(func)()
+        no_sleep.assert_called_once_with(2)
+
+    def test_reads_the_http_method_argument(self, no_sleep):
+        calls = []
+
+        def post(http_method, url):
+            calls.append(http_method)
+            raise requests.exceptions.ReadTimeout()
+
+        wrapped = retry_on_failure(RetryConfig(max_attempts=3))(post)
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            wrapped("POST", "/objectives")
+        assert calls == ["POST"]
+        calls.clear()
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            wrapped(http_method="GET", url="/objectives")
+        assert calls == ["GET"] * 3
+
+    def test_coroutines_sleep_with_asyncio(self):
+        calls = []
+
+        async def fetch():
+            calls.append(None)
+            if len(calls) < 2:
+                raise APIError(503)
+            return "ok"
+
+        wrapped = retry_on_failure(RetryConfig())(fetch)
+        with mock.patch(
+            "unifiedcatalogpy.retry.asyncio.sleep", mock.AsyncMock()
+        ) as sleep:
+            assert asyncio.run(wrapped()) == "ok"
+        assert sleep.await_count == 1
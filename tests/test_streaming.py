@@ -0,0 +1,108 @@
+"""Tests for streaming list responses with ijson."""
+import json
+from unittest import mock
+
+import pytest
+
+from unifiedcatalogpy import utils
+from unifiedcatalogpy.exceptions import RequestError
+from unifiedcatalogpy.utils import parse_page, stream_page
+
+BASE_URL = (
+    "https://account-api.purview-service.microsoft.com/datagovernance/catalog/"
+)
+
+requires_ijson = pytest.mark.skipif(
+    utils.ijson is None, reason="requires the streaming extra"
+)
+
+
+def chunked(body, size):
+    """Split a JSON body into byte chunks of the given size."""
+    raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+def consume(generator):
+    """Collect a stream_page generator's items and its return value."""
+    items = []
+    while True:
+        try:
+            items.append(next(generator))
+        except StopIteration as stop:
+            return items, stop.value
+
+
+class TestStreamPage:
+    page = {
+        "value": [
+            {"id": "1", "contacts": {"owner": [{"id": "a"}]}},
+            {"id": "2", "status": "Draft"},
+        ],
+        "@odata.nextLink": f"{BASE_URL}terms?$skipToken=abc",
+    }
+
+    @requires_ijson
+    @pytest.mark.parametrize("size", [1, 7, 64 * 1024])
+    def test_matches_buffered_parsing_for_any_chunk_size(self, size):
+        items, token = consume(stream_page(chunked(self.page, size)))
+        assert (items, token) == parse_page(self.page)[:2]
+
+    @requires_ijson
+    def test_reads_continuation_token_key(self):
+        body = {"value": [1], "continuationToken": "abc"}
+        assert consume(stream_page(chunked(body, 4))) == ([1], "abc")
+
+    @requires_ijson
+    def test_top_level_array_is_the_page(self):
+        body = [{"item": 1}, [2], 3]
+        assert consume(stream_page(chunked(body, 3))) == (body, None)
+
+    @requires_ijson
+    def test_ignores_item_key_of_top_level_object(self):
+        body = {"item": {"id": "x"}, "value": [1]}
+        assert consume(stream_page(chunked(body, 3))) == ([1], None)
+
+    @requires_ijson
+    def test_skips_empty_chunks(self):
+        assert consume(stream_page([b"", b'{"value": [1]}', b""])) == ([1], None)
+
+    def test_requires_ijson(self):
+        with mock.patch.object(utils, "ijson", None):
+            with pytest.raises(ImportError):
+                next(stream_page([b"{}"]))
+
+    @requires_ijson
+    @pytest.mark.parametrize("body", [b"", b"  ", b"<html></html>"])
+    def test_body_without_json_is_an_empty_page(self, body):
+        assert consume(stream_page(chunked(body, 2))) == ([], None)
+        assert parse_page([]) == ([], None, None)
+
+    @requires_ijson
+    def test_truncated_body_raises_value_error(self):
+        body = b'{"value": [{"id": "1"}, {"id": '
+        with pytest.raises(ValueError):
+            consume(stream_page(chunked(body, 4)))
+
+    @requires_ijson
+    def test_numbers_match_buffered_parsing(self):
+        body = {"value": [2**70, 1.5, {"score": 0.25, "count": 3}]}
+        items, _ = consume(stream_page(chunked(body, 5)))
+        assert items == parse_page(json.loads(json.dumps(body)))[0]
+        assert all(type(a) is type(b) for a, b in zip(items, body["value"]))
+
+
+class TestIterItemsStream:
+    def test_requires_ijson_before_sending(self, api_client):
+        with mock.patch.object(utils, "ijson", None):
+            with pytest.raises(ImportError):
+                next(api_client.iter_items("/terms", stream=True))
+        api_client._session.request.assert_not_called()
+
+    @requires_ijson
+    def test_truncated_body_raises_request_error(self, api_client):
+        response = api_client._session.request.return_value
+        response.iter_content.return_value = [b'{"value": [1, 2']
+        with pytest.raises(RequestError):
+            list(api_client.iter_items("/terms", stream=True))
+        response.close.assert_called_once()
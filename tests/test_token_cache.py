@@ -0,0 +1,63 @@
+"""Tests for access token caching in ApiClient."""
+import threading
+import time
+from unittest import mock
+
+
+def token(value, expires_in):
+    """Build a mock azure.core AccessToken."""
+    return mock.Mock(token=value, expires_on=time.time() + expires_in)
+
+
+class TestTokenCache:
+    def test_token_is_fetched_once_for_many_requests(
+        self, api_client, credential
+    ):
+        for _ in range(3):
+            api_client.get("/terms")
+        credential.get_token.assert_called_once_with(api_client.resource_scope)
+        assert api_client._session.headers["Authorization"] == "Bearer test-token"
+
+    def test_token_is_refreshed_within_the_margin(self, api_client, credential):
+        credential.get_token.side_effect = [
+            token("old", api_client.token_refresh_margin - 1),
+            token("new", 3600),
+        ]
+        api_client.get("/terms")
+        api_client.get("/terms")
+        assert credential.get_token.call_count == 2
+        assert api_client._session.headers["Authorization"] == "Bearer new"
+
+    def test_valid_token_outside_the_margin_is_reused(
+        self, api_client, credential
+    ):
+        credential.get_token.return_value = token(
+            "t", api_client.token_refresh_margin + 60
+        )
+        api_client.get("/terms")
+        api_client.get("/terms")
+        credential.get_token.assert_called_once()
+
+    def test_rotation_clears_the_cache(self, api_client, credential):
+        api_client.cache_ttl = 60
+        credential.get_token.side_effect = [token("old", 0), token("new", 3600)]
+        api_client.get("/terms/1")
+        api_client.get("/terms/2")  # Rotates the token.
+        api_client.get("/terms/1")
+        assert api_client._session.request.call_count == 3
+
+    def test_concurrent_requests_fetch_one_token(self, api_client, credential):
+        def slow_get_token(scope):
+            time.sleep(0.05)
+            return token("t", 3600)
+
+        credential.get_token.side_effect = slow_get_token
+        threads = [
+            threading.Thread(target=api_client.get, args=("/terms",))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        credential.get_token.assert_called_once()
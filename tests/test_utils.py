@@ -0,0 +1,53 @@
+"""Tests for unifiedcatalogpy.utils."""
+import json
+import math
+from unittest import mock
+
+import pytest
+
+from unifiedcatalogpy import utils
+from unifiedcatalogpy.utils import json_dumps, json_loads
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request):
+    """Run a test with orjson, when installed, and with the stdlib only."""
+    if request.param == "orjson":
+        if utils.orjson is None:
+            pytest.skip("requires the speedups extra")
+        yield
+    else:
+        with mock.patch.object(utils, "orjson", None):
+            yield
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestJsonLoads:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'{"value": [{"id": "1", "score": 0.1}], "count": 2}',
+            b"[100000000000000000000, -9223372036854775809]",
+            b'"\\ud800"',
+        ],
+    )
+    def test_matches_the_stdlib(self, content):
+        assert json_loads(content) == json.loads(content)
+
+    def test_accepts_nan_like_the_stdlib(self):
+        assert math.isnan(json_loads(b"[NaN]")[0])
+
+    @pytest.mark.parametrize("content", [b"", b"<html>", b'{"value": ['])
+    def test_invalid_bodies_raise_value_error(self, content):
+        with pytest.raises(ValueError):
+            json_loads(content)
+
+
+class TestJsonDumps:
+    def test_int_keys_become_strings(self):
+        assert json.loads(json_dumps({1: "a"})) == {"1": "a"}
+
+    @pytest.mark.parametrize("value", [math.nan, math.inf])
+    def test_rejects_non_finite_floats(self, value):
+        with pytest.raises(ValueError):
+            json_dumps({"score": value})
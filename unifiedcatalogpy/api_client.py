@@ -1,17 +1,178 @@
 """API client module for making HTTP requests."""
-from typing import Dict
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, Literal, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from unifiedcatalogpy.models import Result
+from unifiedcatalogpy.exceptions import APIError, RequestError
+from unifiedcatalogpy.models import PaginatedResult, PaginationOptions, Result
+from unifiedcatalogpy.retry import RetryConfig, retry_on_failure
+from unifiedcatalogpy.utils import (
+    JSON_HEADERS,
+    is_next_link,
+    json_dumps,
+    json_loads,
+    next_page_request,
+    parse_page,
+    require_ijson,
+    stream_page,
+)
+
+try:
+    import httpx
+except ImportError:  # Optional dependency, only needed for HTTP/2.
+    httpx = None
+
+Transport = Literal["requests", "httpx"]
+CacheKey = Tuple[str, Optional[frozenset]]
+
+# Bytes read from the socket at a time when streaming a response body.
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class ApiClient:
     """HTTP client for making requests to the Unified Catalog API."""
-    def __init__(self, base_url: str, credential: any):
-        self.base_url = base_url
+    def __init__(
+        self,
+        base_url: str,
+        credential: any,
+        timeout: float = 30,
+        transport: Transport = "requests",
+        retry_config: RetryConfig = None,
+        cache_ttl: float = 0,
+    ):
+        # Stored with a trailing slash so endpoints join on exactly one "/".
+        self.base_url = base_url.rstrip("/") + "/"
         self.credential = credential
         self.resource_scope = "73c2949e-da2d-457a-9607-fcc665198967/.default"
+        self.timeout = timeout
+        self.retry_config = retry_config or RetryConfig()
+        self._send_with_retry = retry_on_failure(self.retry_config)(self._send)
+        self._open_stream_with_retry = retry_on_failure(self.retry_config)(
+            self._open_stream
+        )
+
+        # Tokens are refreshed this many seconds before they expire.
+        self.token_refresh_margin = 300
+        self._token = None
+        self._token_lock = threading.Lock()
+
+        # Successful GET responses are cached for cache_ttl seconds (0 = off).
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = 1024
+        self._cache: "OrderedDict[CacheKey, Tuple[float, Result]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # A shared session keeps TCP/TLS connections alive between calls.
+        self.transport = transport
+        if transport == "requests":
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10, pool_maxsize=50, max_retries=0
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._transport_errors = (requests.exceptions.RequestException,)
+            self._body_argument = "data"
+        elif transport == "httpx":
+            if httpx is None:
+                raise ImportError(
+                    "The httpx transport requires the http2 extra: "
+                    "pip install unifiedcatalogpy[http2]"
+                )
+            # HTTP/2 multiplexes concurrent requests over one connection.
+            self._session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=10, max_keepalive_connections=10
+                ),
+                timeout=timeout,
+            )
+            self._transport_errors = (httpx.HTTPError,)
+            self._body_argument = "content"
+        else:
+            raise ValueError(f"Unsupported transport: {transport}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def _token_expiring(self) -> bool:
+        """Check whether the cached access token needs to be refreshed."""
+        return (
+            self._token is None
+            or self._token.expires_on - time.time() < self.token_refresh_margin
+        )
+
+    def _refresh_token(self):
+        """
+        Fetch a new access token when the cached one is missing or close to
+        expiry, and update the session's Authorization header when it rotates.
+        """
+        if not self._token_expiring():
+            return
+        with self._token_lock:
+            if self._token_expiring():
+                self._token = self.credential.get_token(self.resource_scope)
+                self._session.headers["Authorization"] = (
+                    f"Bearer {self._token.token}"
+                )
+                # Cached responses belong to the identity that fetched them.
+                self.clear_cache()
+
+    def clear_cache(self):
+        """Discard all cached GET responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cache_key(self, full_url: str, params: Dict) -> Optional[CacheKey]:
+        """Build a cache key for a GET request, or None if uncacheable."""
+        if not params:
+            return full_url, None
+        try:
+            return full_url, frozenset(params.items())
+        except TypeError:  # Unhashable parameter values, e.g. lists.
+            return None
+
+    def _get_cached(self, key: CacheKey) -> Optional[Result]:
+        """Return a deep copy of a fresh cached response, if there is one."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        # Deep copies keep callers from mutating nested data in the cache.
+        return Result(
+            result.status_code, result.message, copy.deepcopy(result.data)
+        )
+
+    def _store_cached(self, key: CacheKey, result: Result):
+        """Cache a deep copy of a response, evicting the least recently used."""
+        entry = (
+            time.monotonic() + self.cache_ttl,
+            Result(
+                result.status_code, result.message, copy.deepcopy(result.data)
+            ),
+        )
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
 
     def request(
         self,
@@ -20,63 +181,241 @@ class ApiClient:
         params: Dict = None,
         data: Dict = None,
     ) -> Result:
-        """Make HTTP request to API endpoint."""
-        full_url = self.base_url + endpoint
-        token = self.credential.get_token(self.resource_scope).token
-        headers = {"Authorization": f"Bearer {token}"}
+        """
+        Make HTTP request to API endpoint, retrying throttled requests,
+        server errors and transient network failures.
+
+        :raises AuthenticationError: If the API rejects the credential.
+        :raises APIError: If the API responds with any other error status.
+        :raises RequestError: If no response could be obtained.
+        """
+        full_url = self.base_url + endpoint.lstrip("/")
+        cache_key = None
+        if http_method == "GET":
+            if self.cache_ttl > 0:
+                cache_key = self._cache_key(full_url, params)
+            if cache_key is not None:
+                cached = self._get_cached(cache_key)
+                if cached is not None:
+                    return cached
+        elif self._cache:
+            # Writes may change anything previously read.
+            self.clear_cache()
+
         try:
-            response = requests.request(
-                method=http_method,
-                url=full_url,
-                headers=headers,
+            return self._send_with_retry(
+                http_method, full_url, params, data, cache_key
+            )
+        except self._transport_errors as e:
+            raise RequestError("Request failed") from e
+
+    def _send(
+        self,
+        http_method: str,
+        full_url: str,
+        params: Dict,
+        data: Dict,
+        cache_key: CacheKey = None,
+    ) -> Result:
+        """Send a single HTTP request and convert the response."""
+        self._refresh_token()
+        if data is None:
+            response = self._session.request(
+                http_method, full_url, params=params, timeout=self.timeout
+            )
+        else:
+            # Bodies are pre-encoded so both transports send the same bytes.
+            response = self._session.request(
+                http_method,
+                full_url,
                 params=params,
-                json=data,
+                timeout=self.timeout,
+                headers=JSON_HEADERS,
+                **{self._body_argument: json_dumps(data)},
             )
-        except requests.exceptions.RequestException as e:
-            raise Exception("Request failed") from e
+
+        # requests exposes the status text as reason, httpx as reason_phrase.
+        if self.transport == "httpx":
+            reason = response.reason_phrase
+        else:
+            reason = response.reason
 
         if response.status_code == 204:
-            return Result(
-                response.status_code, message=response.reason, data=[]
-            )
+            return Result(response.status_code, message=reason, data=[])
 
         try:
-            data_out = response.json()
-        except requests.exceptions.JSONDecodeError:
+            data_out = json_loads(response.content)
+        except ValueError:
             data_out = []
 
         if 299 >= response.status_code >= 200:
-            return Result(
-                response.status_code, message=response.reason, data=data_out
+            result = Result(response.status_code, message=reason, data=data_out)
+            if cache_key is not None and "no-store" not in response.headers.get(
+                "Cache-Control", ""
+            ):
+                self._store_cached(cache_key, result)
+            return result
+        raise APIError.from_response(
+            response.status_code, reason, response.headers
+        )
+
+    def _open_stream(self, full_url: str, params: Dict):
+        """
+        Send a single streaming GET request and return the response once its
+        status has been checked, without reading the body.
+        """
+        self._refresh_token()
+        if self.transport == "httpx":
+            request = self._session.build_request(
+                "GET", full_url, params=params, timeout=self.timeout
+            )
+            response = self._session.send(request, stream=True)
+            reason = response.reason_phrase
+        else:
+            response = self._session.request(
+                "GET", full_url, params=params, timeout=self.timeout, stream=True
             )
-        raise Exception(f"{response.status_code}: {response.reason}")
+            reason = response.reason
+
+        if not 299 >= response.status_code >= 200:
+            response.close()
+            raise APIError.from_response(
+                response.status_code, reason, response.headers
+            )
+        return response
+
+    def _stream_page(self, endpoint: str, params: Dict):
+        """
+        Stream a single page of a list endpoint, yielding its items as they
+        are parsed. Returns the page's continuation token.
+        """
+        full_url = self.base_url + endpoint.lstrip("/")
+        try:
+            response = self._open_stream_with_retry(full_url, params)
+        except self._transport_errors as e:
+            raise RequestError("Request failed") from e
+
+        try:
+            if response.status_code == 204:
+                return None
+            if self.transport == "httpx":
+                chunks = response.iter_bytes(STREAM_CHUNK_SIZE)
+            else:
+                chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            return (yield from stream_page(chunks))
+        except self._transport_errors as e:
+            raise RequestError("Request failed") from e
+        except ValueError as e:
+            raise RequestError("Invalid response body") from e
+        finally:
+            response.close()
 
     def get(self, endpoint: str, params: Dict = None) -> Result:
         """Make GET request."""
-        return self.request(
-            http_method="GET", endpoint=endpoint, params=params
+        return self.request("GET", endpoint, params)
+
+    def get_paginated(
+        self,
+        endpoint: str,
+        pagination: PaginationOptions = None,
+        params: Dict = None,
+    ) -> PaginatedResult:
+        """
+        Get a single page of results from a list endpoint.
+
+        :param endpoint: The list endpoint to read from.
+        :param pagination: Optional page size and continuation token of the
+            page to fetch. Defaults to the first page of 100 items.
+        :param params: Optional query parameters for the endpoint.
+        :return: The requested page.
+        """
+        pagination = pagination or PaginationOptions()
+        if params is None:
+            page_params = {"$top": pagination.page_size}
+        else:
+            page_params = {**params, "$top": pagination.page_size}
+        if pagination.continuation_token is not None:
+            endpoint, page_params = next_page_request(
+                self.base_url,
+                endpoint,
+                page_params,
+                pagination.continuation_token,
+            )
+
+        response = self.get(endpoint, params=page_params)
+        items, continuation_token, total_count = parse_page(response.data)
+        return PaginatedResult(
+            items,
+            total_count,
+            pagination.page_size,
+            continuation_token,
+            continuation_token is not None,
         )
 
+    def iter_items(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        page_size: int = 100,
+        stream: bool = False,
+    ) -> Iterator[Dict]:
+        """
+        Iterate over every item of a list endpoint, following continuation
+        tokens until the last page.
+
+        :param endpoint: The list endpoint to read from.
+        :param params: Optional query parameters for the endpoint.
+        :param page_size: Optional number of items to request per page.
+        :param stream: Optional flag to parse each page incrementally while
+            it downloads instead of buffering it first. Lowers peak memory
+            for large pages and requires the streaming extra. Streamed pages
+            bypass the GET cache.
+        :return: An iterator over the items of every page.
+        :raises ImportError: If stream is set and ijson is not installed.
+        """
+        if stream:
+            # Fail before sending a request whose body could not be parsed.
+            require_ijson()
+        if params is None:
+            first_params = {"$top": page_size}
+        else:
+            first_params = {**params, "$top": page_size}
+        page_endpoint, page_params = endpoint, first_params
+        while True:
+            if stream:
+                continuation_token = yield from self._stream_page(
+                    page_endpoint, page_params
+                )
+            else:
+                response = self.get(page_endpoint, params=page_params)
+                items, continuation_token, _ = parse_page(response.data)
+                yield from items
+            if continuation_token is None:
+                return
+            if page_params is not None and not is_next_link(
+                continuation_token
+            ):
+                # Only the skip token changes between pages.
+                page_params["$skipToken"] = continuation_token
+            else:
+                page_endpoint, page_params = next_page_request(
+                    self.base_url, endpoint, first_params, continuation_token
+                )
+
     def post(
         self, endpoint: str, params: Dict = None, data: Dict = None
     ) -> Result:
         """Make POST request."""
-        return self.request(
-            http_method="POST", endpoint=endpoint, params=params, data=data
-        )
+        return self.request("POST", endpoint, params, data)
 
     def put(
         self, endpoint: str, params: Dict = None, data: Dict = None
     ) -> Result:
         """Make PUT request."""
-        return self.request(
-            http_method="PUT", endpoint=endpoint, params=params, data=data
-        )
+        return self.request("PUT", endpoint, params, data)
 
     def delete(
         self, endpoint: str, params: Dict = None, data: Dict = None
     ) -> Result:
         """Make DELETE request."""
-        return self.request(
-            http_method="DELETE", endpoint=endpoint, params=params, data=data
-        )
+        return self.request("DELETE", endpoint, params, data)
@@ -0,0 +1,231 @@
+"""Async API client module for making concurrent HTTP requests."""
+import asyncio
+import inspect
+import time
+from typing import AsyncIterator, Awaitable, Dict, Iterable, List
+
+from unifiedcatalogpy.exceptions import APIError, RequestError
+from unifiedcatalogpy.models import Result
+from unifiedcatalogpy.retry import RetryConfig, retry_on_failure
+from unifiedcatalogpy.utils import (
+    JSON_HEADERS,
+    json_dumps,
+    json_loads,
+    next_page_request,
+    parse_page,
+)
+
+try:
+    import httpx
+except ImportError:  # Optional dependency, only needed for async and HTTP/2.
+    httpx = None
+
+
+class AsyncApiClient:
+    """Async HTTP client for making requests to the Unified Catalog API."""
+    def __init__(
+        self,
+        base_url: str,
+        credential: any,
+        timeout: float = 30,
+        retry_config: RetryConfig = None,
+    ):
+        """
+        Initialize the async API client.
+
+        :param base_url: The base URL of the Unified Catalog API.
+        :param credential: The azure.identity credential used to authenticate
+            requests. Both sync credentials and azure.identity.aio credentials
+            are supported.
+        :param timeout: Optional request timeout in seconds.
+        :param retry_config: Optional retry policy. Defaults to RetryConfig().
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncApiClient requires the http2 extra: "
+                "pip install unifiedcatalogpy[http2]"
+            )
+        # Stored with a trailing slash so endpoints join on exactly one "/".
+        self.base_url = base_url.rstrip("/") + "/"
+        self.credential = credential
+        self.resource_scope = "73c2949e-da2d-457a-9607-fcc665198967/.default"
+        self.timeout = timeout
+        self.retry_config = retry_config or RetryConfig()
+        self._send_with_retry = retry_on_failure(self.retry_config)(self._send)
+
+        # Tokens are refreshed this many seconds before they expire.
+        self.token_refresh_margin = 300
+        self._token = None
+        # Created on first use: on Python 3.9 an asyncio.Lock binds to the
+        # event loop current at construction, which may not be the one the
+        # client is later used from.
+        self._token_lock = None
+
+        self._session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        await self._session.aclose()
+
+    def _token_expiring(self) -> bool:
+        """Check whether the cached access token needs to be refreshed."""
+        return (
+            self._token is None
+            or self._token.expires_on - time.time() < self.token_refresh_margin
+        )
+
+    async def _refresh_token(self):
+        """
+        Fetch a new access token when the cached one is missing or close to
+        expiry, and update the session's Authorization header when it rotates.
+        """
+        if not self._token_expiring():
+            return
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if self._token_expiring():
+                token = self.credential.get_token(self.resource_scope)
+                if inspect.isawaitable(token):
+                    token = await token
+                self._token = token
+                self._session.headers["Authorization"] = (
+                    f"Bearer {self._token.token}"
+                )
+
+    async def request(
+        self,
+        http_method: str,
+        endpoint: str,
+        params: Dict = None,
+        data: Dict = None,
+    ) -> Result:
+        """
+        Make HTTP request to API endpoint, retrying throttled requests,
+        server errors and transient network failures.
+
+        :raises AuthenticationError: If the API rejects the credential.
+        :raises APIError: If the API responds with any other error status.
+        :raises RequestError: If no response could be obtained.
+        """
+        full_url = self.base_url + endpoint.lstrip("/")
+        try:
+            return await self._send_with_retry(
+                http_method, full_url, params, data
+            )
+        except httpx.HTTPError as e:
+            raise RequestError("Request failed") from e
+
+    async def _send(
+        self, http_method: str, full_url: str, params: Dict, data: Dict
+    ) -> Result:
+        """Send a single HTTP request and convert the response."""
+        await self._refresh_token()
+        body = {}
+        if data is not None:
+            body = {"content": json_dumps(data), "headers": JSON_HEADERS}
+        response = await self._session.request(
+            http_method, full_url, params=params, **body
+        )
+
+        reason = response.reason_phrase
+        if response.status_code == 204:
+            return Result(response.status_code, message=reason, data=[])
+
+        try:
+            data_out = json_loads(response.content)
+        except ValueError:
+            data_out = []
+
+        if 299 >= response.status_code >= 200:
+            return Result(response.status_code, message=reason, data=data_out)
+        raise APIError.from_response(
+            response.status_code, reason, response.headers
+        )
+
+    async def get(self, endpoint: str, params: Dict = None) -> Result:
+        """Make GET request."""
+        return await self.request("GET", endpoint, params)
+
+    async def post(
+        self, endpoint: str, params: Dict = None, data: Dict = None
+    ) -> Result:
+        """Make POST request."""
+        return await self.request("POST", endpoint, params, data)
+
+    async def put(
+        self, endpoint: str, params: Dict = None, data: Dict = None
+    ) -> Result:
+        """Make PUT request."""
+        return await self.request("PUT", endpoint, params, data)
+
+    async def delete(
+        self, endpoint: str, params: Dict = None, data: Dict = None
+    ) -> Result:
+        """Make DELETE request."""
+        return await self.request("DELETE", endpoint, params, data)
+
+    async def get_paginated_iter(
+        self, endpoint: str, params: Dict = None, page_size: int = 100
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterate over every item of a list endpoint, following continuation
+        tokens. The next page is requested while the current page's items
+        are being consumed.
+
+        :param endpoint: The list endpoint to read from.
+        :param params: Optional query parameters for the endpoint.
+        :param page_size: Optional number of items to request per page.
+        :return: An async iterator over the items of every page.
+        """
+        if params is None:
+            page_params = {"$top": page_size}
+        else:
+            page_params = {**params, "$top": page_size}
+        task = asyncio.ensure_future(self.get(endpoint, params=page_params))
+        try:
+            while task is not None:
+                response = await task
+                items, continuation_token, _ = parse_page(response.data)
+                task = None
+                if continuation_token is not None:
+                    next_endpoint, next_params = next_page_request(
+                        self.base_url, endpoint, page_params, continuation_token
+                    )
+                    task = asyncio.ensure_future(
+                        self.get(next_endpoint, params=next_params)
+                    )
+                for item in items:
+                    yield item
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def gather(
+        self, calls: Iterable[Awaitable], concurrency: int = 10
+    ) -> List:
+        """
+        Await many API calls concurrently, with at most `concurrency` of them
+        in flight at once.
+
+        :param calls: The awaitables to run, e.g. `client.get(...)` calls.
+        :param concurrency: Optional maximum number of concurrent calls.
+        :return: The results, in the same order as `calls`.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(call: Awaitable):
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(run(call) for call in calls))
@@ -1,8 +1,9 @@
 """Microsoft Purview Unified Catalog client module."""
 from typing import List, Literal
 
-from .api_client import ApiClient
-from .utils import format_base_url
+from .api_client import ApiClient, Transport
+from .retry import RetryConfig
+from .utils import format_base_url, format_contacts, format_resources
 
 
 class UnifiedCatalogClient:
@@ -11,17 +12,51 @@ class UnifiedCatalogClient:
     Unified Catalog API.
     """
 
-    def __init__(self, account_id: str, credential: any):
+    def __init__(
+        self,
+        account_id: str,
+        credential: any,
+        transport: Transport = "requests",
+        retry_config: RetryConfig = None,
+        cache_ttl: float = 0,
+    ):
         """
         Initialize the Microsoft Purview Unified Catalog client.
 
         :param account_id: The guid of the Microsoft Purview account.
         :param credential: The azure.identity credential used to authenticate
             requests.
+        :param transport: Optional HTTP transport. "requests" (default) uses
+            HTTP/1.1 connection pooling; "httpx" uses HTTP/2 and requires the
+            http2 extra.
+        :param retry_config: Optional retry policy for throttled requests,
+            server errors and network failures. Defaults to 3 attempts with
+            exponential backoff.
+        :param cache_ttl: Optional number of seconds to cache successful GET
+            responses for. Disabled (0) by default. Any create, update or
+            delete made through this client clears the cache.
         """
         self.account_id = account_id
         self.credential = credential
-        self.api_client = ApiClient(format_base_url(account_id), credential)
+        self.api_client = ApiClient(
+            format_base_url(account_id),
+            credential,
+            transport=transport,
+            retry_config=retry_config,
+            cache_ttl=cache_ttl,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the client and release its pooled HTTP connections.
+        """
+        self.api_client.close()
 
     def get_governance_domains(self):
         """
@@ -32,12 +67,7 @@ class UnifiedCatalogClient:
 
         response = self.api_client.get("/businessdomains")
         if isinstance(response.data, dict) and "value" in response.data:
-            if isinstance(response.data, dict) and "value" in response.data:
-                value = response.data.get("value")
-                if isinstance(value, list):
-                    return value
-                return value
-            return response.data
+            return response.data["value"]
         return response.data
 
     def get_governance_domain_by_id(self, domain_id: str):
@@ -102,12 +132,7 @@ class UnifiedCatalogClient:
             "description": description,
             "type": domain_type,
             "parent_id": parent_id,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"]}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners),
             "status": status,
         }
 
@@ -180,12 +205,9 @@ class UnifiedCatalogClient:
             "description": description,
             "domain": governance_domain_id,
             "parent_id": parent_id,
-            "contacts": {"owner": [{"id": owner["id"]} for owner in (owners or [])]},
+            "contacts": format_contacts(owners),
             "acronyms": acronyms or [],
-            "resources": [
-                {"name": resource["name"], "url": resource["url"]}
-                for resource in (resources or [])
-            ],
+            "resources": format_resources(resources),
             "status": status,
         }
         print(data)
@@ -227,12 +249,9 @@ class UnifiedCatalogClient:
             "description": description,
             "domain": governance_domain_id,
             "parent_id": parent_id,
-            "contacts": {"owner": [{"id": owner["id"]} for owner in (owners or [])]},
+            "contacts": format_contacts(owners),
             "acronyms": acronyms or [],
-            "resources": [
-                {"name": resource["name"], "url": resource["url"]}
-                for resource in (resources or [])
-            ],
+            "resources": format_resources(resources),
             "status": status,
         }
 
@@ -484,12 +503,7 @@ class UnifiedCatalogClient:
             "domain": governance_domain_id,
             "type": product_type,
             "businessUse": business_use,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"], "description": owner.get("description", "")}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners, include_description=True),
             "audience": audience or [],
             "termsOfUse": terms_of_use or [],
             "documentation": documentation or [],
@@ -544,12 +558,7 @@ class UnifiedCatalogClient:
             "domain": governance_domain_id,
             "type": product_type,
             "businessUse": business_use,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"], "description": owner.get("description", "")}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners, include_description=True),
             "audience": audience or [],
             "termsOfUse": terms_of_use or [],
             "documentation": documentation or [],
@@ -611,12 +620,7 @@ class UnifiedCatalogClient:
 
         data = {
             "domain": governance_domain_id,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"], "description": owner.get("description", "")}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners, include_description=True),
             "status": status,
             "definition": definition,
             "targetDate": target_date,
@@ -673,12 +677,7 @@ class UnifiedCatalogClient:
         data = {
             "id": objective_id,
             "domain": governance_domain_id,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"], "description": owner.get("description", "")}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners, include_description=True),
             "status": status,
             "definition": definition,
             "targetDate": target_date,
@@ -734,12 +733,7 @@ class UnifiedCatalogClient:
             "name": name,
             "description": description,
             "domain": governance_domain_id,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"], "description": owner.get("description", "")}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners, include_description=True),
             "status": status,
             "dataType": data_type,
         }
@@ -796,12 +790,7 @@ class UnifiedCatalogClient:
         data = {
             "id": cde_id,
             "domain": governance_domain_id,
-            "contacts": {
-                "owner": [
-                    {"id": owner["id"], "description": owner.get("description", "")}
-                    for owner in (owners or [])
-                ]
-            },
+            "contacts": format_contacts(owners, include_description=True),
             "status": status,
             "name": name,
             "description": description,
@@ -0,0 +1,70 @@
+"""Exceptions raised by the Unified Catalog client."""
+import math
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+class UnifiedCatalogError(Exception):
+    """Base class for all Unified Catalog client errors."""
+
+
+class RequestError(UnifiedCatalogError):
+    """Raised when a request could not be sent or no response was received."""
+
+
+class APIError(UnifiedCatalogError):
+    """Raised when the API responds with a non-success status code."""
+    def __init__(
+        self, status_code: int, reason: str = "", retry_after: float = None
+    ):
+        super().__init__(f"{status_code}: {reason}")
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_response(
+        cls, status_code: int, reason: str, headers: Mapping[str, str]
+    ) -> "APIError":
+        """
+        Build the error matching an unsuccessful API response.
+
+        :param status_code: The HTTP status code of the response.
+        :param reason: The HTTP status text of the response.
+        :param headers: The response headers.
+        :return: An AuthenticationError for 401/403, otherwise an APIError.
+        """
+        error_cls = AuthenticationError if status_code in (401, 403) else cls
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        return error_cls(status_code, reason, retry_after=retry_after)
+
+
+class AuthenticationError(APIError):
+    """
+    Raised when the API rejects the credential (401) or the identity lacks
+    the required Purview role (403).
+    """
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either in seconds or as an HTTP date.
+
+    :param value: The raw header value.
+    :return: The number of seconds to wait, or None if absent or invalid.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # float() also accepts "inf" and "nan", which are not valid delays.
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
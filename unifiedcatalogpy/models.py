@@ -4,9 +4,46 @@ from typing import Dict, List
 
 class Result:
     """Represents an API response result."""
+    __slots__ = ("status_code", "message", "data")
+
     def __init__(
         self, status_code: int, message: str = "", data: List[Dict] = None
     ):
-        self.status_code = int(status_code)
-        self.message = str(message)
+        self.status_code = status_code
+        self.message = message
         self.data = data if data else []
+
+
+class PaginationOptions:
+    """Options for requesting a single page of a list endpoint."""
+    __slots__ = ("page_size", "continuation_token")
+
+    def __init__(self, page_size: int = 100, continuation_token: str = None):
+        self.page_size = page_size
+        self.continuation_token = continuation_token
+
+
+class PaginatedResult:
+    """Represents a single page of results from a list endpoint."""
+    __slots__ = (
+        "items", "total_count", "page_size", "continuation_token", "has_more"
+    )
+
+    def __init__(
+        self,
+        items: List[Dict] = None,
+        total_count: int = None,
+        page_size: int = 100,
+        continuation_token: str = None,
+        has_more: bool = False,
+    ):
+        self.items = items if items else []
+        self.total_count = total_count
+        self.page_size = page_size
+        self.continuation_token = continuation_token
+        self.has_more = has_more
+
+    @property
+    def count(self) -> int:
+        """The number of items on this page."""
+        return len(self.items)
@@ -0,0 +1,285 @@
+"""Retry helpers with truncated exponential backoff and jitter."""
+import asyncio
+import functools
+import inspect
+import math
+import random
+import time
+from typing import Callable, Iterable, List, Tuple, Type
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from unifiedcatalogpy.exceptions import APIError, AuthenticationError
+
+try:
+    import httpx
+except ImportError:  # Optional dependency, only needed for HTTP/2.
+    httpx = None
+
+_RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+if httpx is not None:
+    _RETRYABLE_EXCEPTIONS += (httpx.TimeoutException, httpx.NetworkError)
+
+# Transport errors raised before any part of the request reached the server.
+_NOT_SENT_EXCEPTIONS = (requests.exceptions.ConnectTimeout,)
+if httpx is not None:
+    _NOT_SENT_EXCEPTIONS += (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Methods that can be repeated without changing the outcome (RFC 9110).
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# A private generator keeps jitter independent of random.seed() calls made
+# by the application, so seeded processes don't all retry in lockstep.
+_random = random.Random()
+
+
+def _capped_backoff(
+    base_delay: float, exponential_base: float, max_delay: float, count: int
+) -> List[float]:
+    """
+    Compute the first `count` backoff delays, each capped at max_delay.
+
+    The delay stops growing once it reaches the cap, so long schedules never
+    evaluate powers large enough to overflow.
+    """
+    delays = []
+    delay = base_delay
+    while len(delays) < count:
+        if delay >= max_delay:
+            delays.extend([max_delay] * (count - len(delays)))
+            break
+        delays.append(delay)
+        delay *= exponential_base
+    return delays
+
+
+class RetryConfig:
+    """
+    Retry policy for API requests. The backoff schedule is computed once at
+    construction, so the attributes it depends on (max_attempts, base_delay,
+    max_delay and exponential_base) are read-only.
+
+    Idempotent requests (GET, PUT, DELETE) are retried on any retryable
+    status code or exception. Other requests, such as POST, may already have
+    been applied when a response is lost or the server fails, so they are
+    only retried when the server provably did not act on them: connection
+    failures before the request was sent, 429, and 503 with Retry-After.
+    """
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        exponential_base: float = 2.0,
+        jitter: float = 0.5,
+        retryable_status_codes: Iterable[int] = (429, 500, 502, 503, 504),
+        retryable_exceptions: Tuple[Type[Exception], ...] = _RETRYABLE_EXCEPTIONS,
+    ):
+        """
+        Initialize the retry policy.
+
+        :param max_attempts: Total number of attempts, including the first
+            one. Set to 1 to disable retries.
+        :param base_delay: Delay in seconds before the first retry.
+        :param max_delay: Upper bound in seconds for the computed backoff.
+        :param exponential_base: Factor the delay grows by on each retry.
+        :param jitter: Fraction of the delay to randomise by, in either
+            direction, from 0 to 1. Set to 0 to disable jitter.
+        :param retryable_status_codes: HTTP status codes worth retrying.
+        :param retryable_exceptions: Transport exceptions worth retrying.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer.")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("base_delay and max_delay must not be negative.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._exponential_base = exponential_base
+        self.jitter = jitter
+        # Stored as a frozenset for O(1) membership tests in should_retry.
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.retryable_exceptions = tuple(retryable_exceptions)
+
+        # Capped backoff before each retry, indexed by the failed attempt.
+        self._delays = (0.0,) + tuple(
+            _capped_backoff(
+                base_delay, exponential_base, max_delay, max_attempts - 1
+            )
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        """Total number of attempts, including the first one."""
+        return self._max_attempts
+
+    @property
+    def base_delay(self) -> float:
+        """Delay in seconds before the first retry."""
+        return self._base_delay
+
+    @property
+    def max_delay(self) -> float:
+        """Upper bound in seconds for the computed backoff."""
+        return self._max_delay
+
+    @property
+    def exponential_base(self) -> float:
+        """Factor the delay grows by on each retry."""
+        return self._exponential_base
+
+
+def calculate_delay(
+    attempt: int, config: RetryConfig, retry_after: float = None
+) -> float:
+    """
+    Calculate how long to wait before retrying.
+
+    :param attempt: The number of the attempt that just failed, from 1.
+    :param config: The retry policy.
+    :param retry_after: Optional server-provided Retry-After in seconds. It is
+        used without jitter, so the client never retries sooner than asked.
+        Non-finite values are ignored and larger ones are capped at
+        config.max_delay, though should_retry already gives up on those.
+    :return: The delay in seconds.
+    """
+    if retry_after is not None and math.isfinite(retry_after):
+        return min(max(0.0, retry_after), config.max_delay)
+    if attempt < len(config._delays):
+        delay = config._delays[attempt]
+    else:
+        try:
+            delay = min(
+                config.max_delay,
+                config.base_delay * config.exponential_base ** (attempt - 1),
+            )
+        except OverflowError:  # The uncapped delay is past any max_delay.
+            delay = config.max_delay
+    if config.jitter:
+        delay *= 1 + _random.uniform(-config.jitter, config.jitter)
+    # jitter can still be changed after construction; never sleep < 0.
+    return max(0.0, delay)
+
+
+def _request_not_sent(exception: Exception) -> bool:
+    """Check whether a transport error happened before the request was sent."""
+    if isinstance(exception, _NOT_SENT_EXCEPTIONS):
+        return True
+    # requests wraps connection failures in a ConnectionError whose argument
+    # is urllib3's MaxRetryError; its reason tells them apart from errors
+    # raised after the request was written, such as a dropped connection.
+    if isinstance(exception, requests.exceptions.ConnectionError):
+        if not exception.args:
+            return False
+        reason = getattr(exception.args[0], "reason", None)
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def should_retry(
+    exception: Exception, config: RetryConfig, http_method: str = "GET"
+) -> bool:
+    """
+    Decide whether a failed attempt should be retried.
+
+    :param exception: The exception raised by the attempt.
+    :param config: The retry policy.
+    :param http_method: Optional HTTP method of the failed request.
+        Non-idempotent methods are only retried when the server provably did
+        not act on the request.
+    :return: True for throttling, server errors and transient network
+        errors; False for authentication and other client errors, and for
+        responses asking to wait longer than config.max_delay.
+    """
+    if isinstance(exception, AuthenticationError):
+        return False
+    retry_after = getattr(exception, "retry_after", None)
+    # Surfacing the error beats blocking the caller for a long wait. The
+    # inverted comparison also rejects NaN.
+    if retry_after is not None and not retry_after <= config.max_delay:
+        return False
+    idempotent = http_method.upper() in IDEMPOTENT_METHODS
+    if isinstance(exception, APIError):
+        if exception.status_code not in config.retryable_status_codes:
+            return False
+        if idempotent or exception.status_code == 429:
+            return True
+        return exception.status_code == 503 and retry_after is not None
+    if not isinstance(exception, config.retryable_exceptions):
+        return False
+    return idempotent or _request_not_sent(exception)
+
+
+def _http_method(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Look up the http_method argument of a call, defaulting to GET."""
+    try:
+        arguments = signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        return "GET"
+    return arguments.get("http_method", "GET")
+
+
+def retry_on_failure(config: RetryConfig = None) -> Callable:
+    """
+    Decorate a function so it is retried according to a retry policy.
+
+    Coroutine functions are supported too: their wrapper waits with
+    asyncio.sleep, so the event loop keeps serving other requests during
+    the backoff.
+
+    If the decorated function takes an `http_method` argument, it is passed
+    to should_retry so non-idempotent requests are not repeated unsafely.
+    Functions without one are treated as GET requests.
+
+    :param config: Optional retry policy. Defaults to RetryConfig().
+    :return: The decorator.
+    """
+    config = config or RetryConfig()
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(1, config.max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == config.max_attempts or not should_retry(
+                            e, config, _http_method(signature, args, kwargs)
+                        ):
+                            raise
+                        await asyncio.sleep(
+                            calculate_delay(
+                                attempt, config, getattr(e, "retry_after", None)
+                            )
+                        )
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, config.max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == config.max_attempts or not should_retry(
+                        e, config, _http_method(signature, args, kwargs)
+                    ):
+                        raise
+                    time.sleep(
+                        calculate_delay(
+                            attempt, config, getattr(e, "retry_after", None)
+                        )
+                    )
+
+        return wrapper
+
+    return decorator
@@ -1,4 +1,27 @@
 """Utility functions for the Unified Catalog client."""
+import itertools
+import json
+import re
+from decimal import Decimal
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from unifiedcatalogpy.exceptions import RequestError
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, only needed for faster JSON.
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, only needed for streaming.
+    ijson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Digit runs this long may be integers outside orjson's 64-bit range.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+CONTINUATION_KEYS = ("@odata.nextLink", "continuationToken")
 
 
 def format_base_url(account_id: str) -> str:
@@ -12,3 +35,216 @@ def format_base_url(account_id: str) -> str:
         f"https://{account_id}-api.purview-service.microsoft.com/"
         "datagovernance/catalog"
     )
+
+
+def format_contacts(
+    owners: List[dict] = None, include_description: bool = False
+) -> Dict[str, List[dict]]:
+    """
+    Build the contacts payload for a business concept from its owners.
+
+    :param owners: Optional owners, each a dictionary with an Entra ID 'id'
+        key and, optionally, a 'description' key.
+    :param include_description: Whether to send each owner's description.
+    :return: The contacts payload, e.g. {"owner": [{"id": "..."}]}.
+    """
+    if not owners:
+        return {"owner": []}
+    if include_description:
+        return {
+            "owner": [
+                {"id": owner["id"], "description": owner.get("description", "")}
+                for owner in owners
+            ]
+        }
+    return {"owner": [{"id": owner["id"]} for owner in owners]}
+
+
+def format_resources(resources: List[dict] = None) -> List[dict]:
+    """
+    Build the resources payload for a glossary term.
+
+    :param resources: Optional resources, each a dictionary with 'name' and
+        'url' keys.
+    :return: The resources payload.
+    """
+    if not resources:
+        return []
+    return [
+        {"name": resource["name"], "url": resource["url"]}
+        for resource in resources
+    ]
+
+
+def json_loads(content: bytes) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    The result is the same as with the stdlib json module: bodies orjson
+    rejects (e.g. NaN literals) or may round (integers beyond 64 bits) are
+    decoded by the stdlib instead.
+
+    :param content: The raw response body.
+    :return: The decoded JSON value.
+    :raises ValueError: If the body is not valid JSON.
+    """
+    if orjson is not None and not _LONG_DIGITS.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    Encode a request body as UTF-8 JSON.
+
+    The stdlib is used even when orjson is installed: orjson encodes NaN as
+    null and accepts types such as datetime that json rejects, so the body
+    sent would depend on the optional extra. Request bodies are small, so
+    its speedup there is negligible.
+
+    :param data: The value to encode.
+    :return: The encoded JSON body.
+    :raises ValueError: If the data contains NaN or infinite floats.
+    """
+    return json.dumps(data, allow_nan=False).encode("utf-8")
+
+
+def parse_page(data: Any) -> Tuple[List, Optional[str], Optional[int]]:
+    """
+    Split a list response into its items, continuation token and total count.
+
+    :param data: The decoded JSON body of a list endpoint.
+    :return: A tuple of (items, continuation_token, total_count).
+    """
+    if not isinstance(data, dict):
+        return data, None, None
+    # Avoid get("value", []), which allocates a default list on every call.
+    items = data.get("value")
+    if items is None:
+        items = []
+    continuation_token = (
+        data.get(CONTINUATION_KEYS[0]) or data.get(CONTINUATION_KEYS[1])
+    )
+    total_count = data.get("@odata.count") or data.get("totalCount")
+    return items, continuation_token, total_count
+
+
+def require_ijson():
+    """
+    Check that ijson is available for streaming responses.
+
+    :raises ImportError: If ijson is not installed.
+    """
+    if ijson is None:
+        raise ImportError(
+            "Streaming requires the streaming extra: "
+            "pip install unifiedcatalogpy[streaming]"
+        )
+
+
+def stream_page(chunks: Iterable[bytes]) -> Generator[Any, None, Optional[str]]:
+    """
+    Incrementally parse a list response, yielding each item of its value
+    array as soon as it has been read rather than after the whole body
+    has been buffered and decoded.
+
+    :param chunks: The response body as an iterable of byte chunks.
+    :return: A generator over the page's items. Its return value (the value
+        of `yield from`) is the page's continuation token, or None. Like
+        parse_page, a body that is empty or not JSON at all is an empty page.
+    :raises ImportError: If ijson is not installed.
+    :raises ValueError: If the body is truncated or invalid partway through.
+    """
+    require_ijson()
+    events = ijson.sendable_list()
+    # Integers are parsed exactly; only non-integers need converting from
+    # Decimal. use_float=True would make yajl2_c reject integers > 64 bits.
+    parser = ijson.parse_coro(events)
+    tokens = {}
+    builder = None
+    # Like parse_page, a top-level array is the page itself and a top-level
+    # object holds the page under "value". Set from the first event.
+    item_prefix = None
+    # A trailing None closes the parser so it flushes its final events.
+    for chunk in itertools.chain(chunks, (None,)):
+        try:
+            if chunk is None:
+                parser.close()
+            elif chunk:
+                parser.send(chunk)
+        except ijson.JSONError as e:
+            if item_prefix is None and not events:
+                return None
+            raise ValueError("Invalid or truncated JSON response body") from e
+        for prefix, event, value in events:
+            if event == "number" and isinstance(value, Decimal):
+                value = float(value)
+            if item_prefix is None:
+                item_prefix = "item" if event == "start_array" else "value.item"
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event in ("end_map", "end_array"):
+                    yield builder.value
+                    builder = None
+            elif prefix == item_prefix:
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    yield value
+            elif prefix in CONTINUATION_KEYS and event == "string":
+                tokens[prefix] = value
+        del events[:]
+    return next((tokens[key] for key in CONTINUATION_KEYS if tokens.get(key)), None)
+
+
+def is_next_link(continuation_token: str) -> bool:
+    """
+    Check whether a continuation token is a full URL rather than an opaque
+    skip token.
+
+    :param continuation_token: The token returned with the previous page.
+    :return: True if the token is an http(s) URL.
+    """
+    if "://" not in continuation_token:
+        return False
+    parts = urlsplit(continuation_token)
+    return parts.scheme.lower() in ("http", "https") and bool(parts.netloc)
+
+
+def next_page_request(
+    base_url: str, endpoint: str, params: Dict, continuation_token: str
+) -> Tuple[str, Optional[Dict]]:
+    """
+    Build the endpoint and query parameters for the next page of results.
+
+    A continuation token that is a full next link under base_url is followed
+    as-is; any other token is sent back as the $skipToken parameter.
+
+    :param base_url: The base URL of the API client.
+    :param endpoint: The endpoint of the first page.
+    :param params: The query parameters of the first page.
+    :param continuation_token: The token returned with the previous page.
+    :return: A tuple of (endpoint, params) for the next request.
+    :raises RequestError: If the token is a URL outside base_url. Sending it
+        back as a skip token could make the server return it forever.
+    """
+    if not is_next_link(continuation_token):
+        return endpoint, {**params, "$skipToken": continuation_token}
+    if continuation_token.startswith(base_url):
+        return continuation_token[len(base_url):], None
+    # Scheme and host are case-insensitive; the path is not.
+    link, base = urlsplit(continuation_token), urlsplit(base_url)
+    if (
+        link.scheme.lower() == base.scheme.lower()
+        and link.netloc.lower() == base.netloc.lower()
+        and link.path.startswith(base.path)
+    ):
+        relative = link.path[len(base.path):]
+        return relative + (f"?{link.query}" if link.query else ""), None
+    raise RequestError(
+        f"Next page link is outside the API base URL: {continuation_token}"
+    )